@@ -8,7 +8,7 @@ from dataclasses import replace
 from pathlib import Path
 
 from .config import load_config
-from .digest import run
+from .digest import run, write_digest
 
 
 def validate_output_path(output_path: Path) -> Path:
@@ -73,7 +73,7 @@ def main() -> None:
     result = run(config)
     if args.output:
         validated_output = validate_output_path(args.output)
-        validated_output.write_text(result.digest.to_markdown(), encoding="utf-8")
+        write_digest(result.digest, validated_output)
 
 
 if __name__ == "__main__":
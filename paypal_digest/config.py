@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -12,6 +13,12 @@ DEFAULT_DATA_DIR = Path(os.getenv("PAYPAL_DIGEST_DATA_DIR", "data"))
 DEFAULT_DIGEST_DIR = DEFAULT_DATA_DIR / "digests"
 DEFAULT_STATE_FILE = DEFAULT_DATA_DIR / "state.json"
 
+# Summarizer backends that need every text up front to summarize them together.
+BATCH_BACKENDS = frozenset({"transformer", "embedding", "tfidf"})
+SUMMARIZER_BACKENDS = frozenset({"lsa"}) | BATCH_BACKENDS
+
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class Config:
@@ -31,6 +38,9 @@ class Config:
     max_content_chars: int = 2000
     summary_sentence_count: int = 3
     summary_fallback_words: int = 60
+    enrichment_workers: int = 8
+    summarizer_backend: str = "lsa"
+    quantize_summarizer: bool = False
 
     @property
     def digest_path(self) -> Path:
@@ -43,7 +53,20 @@ def load_config() -> Config:
     """Load configuration from environment variables and defaults."""
 
     newsapi_key = os.getenv("NEWSAPI_KEY")
-    config = Config(newsapi_key=newsapi_key)
+    summarizer_backend = os.getenv("PAYPAL_DIGEST_SUMMARIZER", "lsa").strip().lower()
+    if summarizer_backend not in SUMMARIZER_BACKENDS:
+        LOGGER.warning(
+            "Unknown PAYPAL_DIGEST_SUMMARIZER %r (expected one of %s); using lsa.",
+            summarizer_backend,
+            ", ".join(sorted(SUMMARIZER_BACKENDS)),
+        )
+        summarizer_backend = "lsa"
+    quantize_summarizer = os.getenv("PAYPAL_DIGEST_QUANTIZE", "").strip().lower() in {"1", "true", "yes"}
+    config = Config(
+        newsapi_key=newsapi_key,
+        summarizer_backend=summarizer_backend,
+        quantize_summarizer=quantize_summarizer,
+    )
 
     # Ensure directories exist when configuration is loaded.
     config.data_dir.mkdir(parents=True, exist_ok=True)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
 import requests
 from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .config import Config
+from .http import get_session
 from .models import Article
 
 LOGGER = logging.getLogger(__name__)
@@ -21,9 +22,9 @@ LOGGER = logging.getLogger(__name__)
     wait=wait_exponential(multiplier=1, min=1, max=10),
     reraise=True
 )
-def _fetch_article_html(url: str, timeout: int) -> requests.Response:
+def _fetch_article_html(url: str, config: Config) -> requests.Response:
     """Fetch article HTML with retry logic."""
-    response = requests.get(url, timeout=timeout)
+    response = get_session(config.data_dir).get(url, timeout=config.request_timeout)
     response.raise_for_status()
     return response
 
@@ -38,20 +39,27 @@ def enrich_article_content(article: Article, config: Config) -> Article:
         return article
 
     try:
-        response = _fetch_article_html(article.url, config.request_timeout)
+        response = _fetch_article_html(article.url, config)
     except requests.RequestException as exc:
         LOGGER.debug("Unable to fetch article body for %s: %s", article.url, exc)
         return article
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    paragraphs = [p.get_text(strip=True) for p in soup.select("p") if p.get_text(strip=True)]
+    soup = BeautifulSoup(response.content, "lxml")
+    paragraphs: List[str] = []
+    total = 0
+    for paragraph in soup.select("p"):
+        paragraph_text = paragraph.get_text(strip=True)
+        if not paragraph_text:
+            continue
+        paragraphs.append(paragraph_text)
+        total += len(paragraph_text) + 2
+        # Stop once the budget is met rather than extracting the whole page.
+        if total >= config.max_content_chars:
+            break
     if not paragraphs:
         return article
 
-    text = "\n\n".join(paragraphs)
-    if len(text) > config.max_content_chars:
-        text = text[:config.max_content_chars]
-    article.content = text
+    article.content = "\n\n".join(paragraphs)[:config.max_content_chars]
     return article
 
 
@@ -2,22 +2,26 @@
 
 from __future__ import annotations
 
+import io
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from .config import Config, load_config
 from .content import best_text
 from .fetchers import collect_articles
+from .models import Article
 from .state import StateStore
-from .summarizer import summarize_text
+from .summarizer import iter_summaries
 
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestItem:
     title: str
     source: str
@@ -26,26 +30,31 @@ class DigestItem:
     summary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Digest:
     created_at: datetime
     items: List[DigestItem]
 
     def to_markdown(self) -> str:
-        lines = [f"# PayPal Daily Digest — {self.created_at.strftime('%Y-%m-%d')}", ""]
+        buffer = io.StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+
+    def write_to(self, stream: TextIO) -> None:
+        """Write the digest as Markdown to an open text stream."""
+
+        stream.write(f"# PayPal Daily Digest — {self.created_at.strftime('%Y-%m-%d')}\n")
         for item in self.items:
             published = item.published_at.strftime("%Y-%m-%d %H:%M") if item.published_at else "Unknown"
-            lines.append(f"## {item.title}")
-            lines.append(f"*Source:* {item.source} — *Published:* {published}")
-            lines.append("")
-            lines.append(item.summary.strip())
-            lines.append("")
-            lines.append(f"[Read more]({item.url})")
-            lines.append("")
-        return "\n".join(lines).strip() + "\n"
+            stream.write(
+                f"\n## {item.title}\n"
+                f"*Source:* {item.source} — *Published:* {published}\n"
+                f"\n{item.summary.strip()}\n"
+                f"\n[Read more]({item.url})\n"
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestResult:
     digest: Digest
     new_article_ids: List[str]
@@ -54,21 +63,23 @@ class DigestResult:
 def build_digest(config: Config) -> DigestResult:
     LOGGER.info("Starting digest build")
     state = StateStore(config.state_file)
-    articles = collect_articles(config)
+    articles = collect_articles(config, seen_ids=state.seen_ids)
 
+    # Built-in fetchers already drop seen IDs; re-check for custom fetchers whose fetch() has no seen_ids.
     fresh_articles = [article for article in articles if article.id not in state.seen_ids]
     fresh_articles.sort(key=lambda art: art.published_at or datetime.min, reverse=True)
-    LOGGER.info("Processing %d new articles (skipped %d duplicates)", len(fresh_articles), len(articles) - len(fresh_articles))
+    LOGGER.info("Processing %d new articles", len(fresh_articles))
 
     digest_items: List[DigestItem] = []
     processed_ids: List[str] = []
 
-    for article in fresh_articles:
-        text = best_text(article, config)
-        if not text:
-            LOGGER.debug("Skipping article with no text: %s", article.url)
-            continue
-        summary = summarize_text(text, config)
+    # Scraping is I/O bound and runs on worker threads; map() yields bodies in order as they
+    # arrive, so summarizing one article overlaps with scraping the ones after it.
+    with ThreadPoolExecutor(max_workers=config.enrichment_workers) as executor:
+        texts = executor.map(lambda article: best_text(article, config), fresh_articles)
+        summarized = list(iter_summaries(_articles_with_text(fresh_articles, texts), config))
+
+    for article, summary in summarized:
         digest_items.append(
             DigestItem(
                 title=article.title,
@@ -82,8 +93,9 @@ def build_digest(config: Config) -> DigestResult:
 
     digest = Digest(created_at=config.digest_date, items=digest_items)
 
+    articles_by_id = {article.id: article for article in fresh_articles}
     for article_id in processed_ids:
-        matching = next((a for a in fresh_articles if a.id == article_id), None)
+        matching = articles_by_id.get(article_id)
         state.mark_seen(article_id, matching.title if matching else "")
     state.save()
 
@@ -91,9 +103,18 @@ def build_digest(config: Config) -> DigestResult:
     return DigestResult(digest=digest, new_article_ids=processed_ids)
 
 
+def _articles_with_text(articles: Iterable[Article], texts: Iterable[Optional[str]]) -> Iterator[Tuple[Article, str]]:
+    for article, text in zip(articles, texts, strict=True):
+        if not text:
+            LOGGER.debug("Skipping article with no text: %s", article.url)
+            continue
+        yield article, text
+
+
 def write_digest(digest: Digest, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(digest.to_markdown(), encoding="utf-8")
+    with path.open("w", encoding="utf-8") as handle:
+        digest.write_to(handle)
     LOGGER.info("Digest written to %s", path)
 
 
@@ -102,7 +123,8 @@ def run(config: Config | None = None) -> DigestResult:
     result = build_digest(config)
     if result.digest.items:
         write_digest(result.digest, config.digest_path)
-        print(result.digest.to_markdown())
+        result.digest.write_to(sys.stdout)
+        print()
     else:
         LOGGER.warning("No digest items produced for %s", config.digest_date.strftime("%Y-%m-%d"))
     return result
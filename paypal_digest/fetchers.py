@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import hashlib
+import inspect
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Iterable, List, Optional
+from typing import AbstractSet, Iterable, List, Optional
 
 import requests
 from bs4 import BeautifulSoup
@@ -14,10 +17,14 @@ import feedparser
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .config import Config
+from .http import get_session
 from .models import Article
 
 LOGGER = logging.getLogger(__name__)
 
+# Matched as substrings, like the keyword scan it replaces, so forms such as "PayPalCredit" still count.
+_RELEVANT_RE = re.compile(r"paypal|pypl", re.IGNORECASE)
+
 
 # Retry decorator for HTTP requests
 def retry_http_request():
@@ -39,7 +46,8 @@ class NewsFetcher:
 
     name: str = "base"
 
-    def fetch(self, config: Config) -> List[Article]:
+    def fetch(self, config: Config, seen_ids: AbstractSet[str] = frozenset()) -> List[Article]:
+        """Return articles from this source, skipping any whose ID is in ``seen_ids``."""
         raise NotImplementedError
 
     @staticmethod
@@ -63,11 +71,13 @@ class NewsAPIFetcher(NewsFetcher):
             "sortBy": "publishedAt",
         }
         headers = {"Authorization": config.newsapi_key}
-        response = requests.get(self.API_URL, params=params, headers=headers, timeout=config.request_timeout)
+        response = get_session(config.data_dir).get(
+            self.API_URL, params=params, headers=headers, timeout=config.request_timeout
+        )
         response.raise_for_status()
         return response
 
-    def fetch(self, config: Config) -> List[Article]:
+    def fetch(self, config: Config, seen_ids: AbstractSet[str] = frozenset()) -> List[Article]:
         if not config.newsapi_key:
             LOGGER.warning("Skipping NewsAPI fetcher – NEWSAPI_KEY not configured.")
             return []
@@ -80,11 +90,16 @@ class NewsAPIFetcher(NewsFetcher):
 
         payload = response.json()
         articles = []
+        skipped = 0
         for item in payload.get("articles", []):
             title = item.get("title")
             url = item.get("url")
             if not title or not url:
                 continue
+            article_id = self._canonical_id(self.name, url)
+            if article_id in seen_ids:
+                skipped += 1
+                continue
             content = item.get("content")
             summary = item.get("description")
             published_at = self._parse_datetime(item.get("publishedAt"))
@@ -96,10 +111,10 @@ class NewsAPIFetcher(NewsFetcher):
                 summary=summary,
                 content=content,
                 author=item.get("author"),
-                id=self._canonical_id(self.name, url),
+                id=article_id,
             )
             articles.append(article)
-        LOGGER.info("Fetched %d articles from NewsAPI", len(articles))
+        LOGGER.info("Fetched %d articles from NewsAPI (skipped %d already seen)", len(articles), skipped)
         return articles
 
     @staticmethod
@@ -120,11 +135,11 @@ class GoogleNewsFetcher(NewsFetcher):
     @retry_http_request()
     def _make_request(self, config: Config) -> requests.Response:
         """Make HTTP request with retry logic."""
-        response = requests.get(self.RSS_URL, timeout=config.request_timeout)
+        response = get_session(config.data_dir).get(self.RSS_URL, timeout=config.request_timeout)
         response.raise_for_status()
         return response
 
-    def fetch(self, config: Config) -> List[Article]:
+    def fetch(self, config: Config, seen_ids: AbstractSet[str] = frozenset()) -> List[Article]:
         try:
             response = self._make_request(config)
         except requests.RequestException as exc:
@@ -133,12 +148,18 @@ class GoogleNewsFetcher(NewsFetcher):
 
         feed = feedparser.parse(response.content)
         articles: List[Article] = []
+        skipped = 0
         for entry in feed.entries:
             title = entry.get("title")
             link = entry.get("link")
             if not title or not link:
                 continue
-            summary = BeautifulSoup(entry.get("summary", ""), "html.parser").get_text()
+            # Check the ID before sanitizing the summary HTML, which is the costly part.
+            article_id = self._canonical_id(self.name, link)
+            if article_id in seen_ids:
+                skipped += 1
+                continue
+            summary = BeautifulSoup(entry.get("summary", ""), "lxml").get_text()
             published_at = None
             if "published" in entry:
                 published_at = NewsAPIFetcher._parse_datetime(entry.get("published"))
@@ -149,10 +170,10 @@ class GoogleNewsFetcher(NewsFetcher):
                 published_at=published_at,
                 summary=summary,
                 content=None,
-                id=self._canonical_id(self.name, link),
+                id=article_id,
             )
             articles.append(article)
-        LOGGER.info("Fetched %d articles from Google News RSS", len(articles))
+        LOGGER.info("Fetched %d articles from Google News RSS (skipped %d already seen)", len(articles), skipped)
         return articles
 
 
@@ -165,19 +186,20 @@ class PYMNTSFetcher(NewsFetcher):
     @retry_http_request()
     def _make_request(self, config: Config) -> requests.Response:
         """Make HTTP request with retry logic."""
-        response = requests.get(self.SOURCE_URL, timeout=config.request_timeout)
+        response = get_session(config.data_dir).get(self.SOURCE_URL, timeout=config.request_timeout)
         response.raise_for_status()
         return response
 
-    def fetch(self, config: Config) -> List[Article]:
+    def fetch(self, config: Config, seen_ids: AbstractSet[str] = frozenset()) -> List[Article]:
         try:
             response = self._make_request(config)
         except requests.RequestException as exc:
             LOGGER.error("PYMNTS request failed after retries: %s", exc)
             return []
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml")
         articles: List[Article] = []
+        skipped = 0
         for card in soup.select("article.post"):
             header = card.select_one("h2.entry-title a")
             if not header:
@@ -186,6 +208,10 @@ class PYMNTSFetcher(NewsFetcher):
             link = header.get("href")
             if not title or not link:
                 continue
+            article_id = self._canonical_id(self.name, link)
+            if article_id in seen_ids:
+                skipped += 1
+                continue
             summary_elem = card.select_one("div.entry-excerpt p")
             summary = summary_elem.get_text(strip=True) if summary_elem else None
             date_elem = card.select_one("time")
@@ -199,44 +225,73 @@ class PYMNTSFetcher(NewsFetcher):
                 published_at=published_at,
                 summary=summary,
                 content=None,
-                id=self._canonical_id(self.name, link),
+                id=article_id,
             )
             articles.append(article)
-        LOGGER.info("Fetched %d articles from PYMNTS", len(articles))
+        LOGGER.info("Fetched %d articles from PYMNTS (skipped %d already seen)", len(articles), skipped)
         return articles
 
 
-def collect_articles(config: Config, fetchers: Optional[Iterable[NewsFetcher]] = None) -> List[Article]:
-    """Collect articles from all configured fetchers."""
+def collect_articles(
+    config: Config,
+    fetchers: Optional[Iterable[NewsFetcher]] = None,
+    seen_ids: AbstractSet[str] = frozenset(),
+) -> List[Article]:
+    """Collect articles from all configured fetchers.
+
+    Articles whose IDs are in ``seen_ids`` (typically already processed in a
+    previous run) are dropped by the fetchers before they are parsed.
+    """
 
     fetchers = list(fetchers or [NewsAPIFetcher(), GoogleNewsFetcher(), PYMNTSFetcher()])
+    get_session(config.data_dir)  # Create the shared session before worker threads race to do so.
     aggregated: List[Article] = []
-    seen_ids = set()
+    collected_ids = set()
 
-    for fetcher in fetchers:
-        try:
-            items = fetcher.fetch(config)
-        except (requests.RequestException, ValueError, KeyError) as exc:
-            LOGGER.error("Fetcher %s failed: %s", fetcher.name, exc)
-            continue
-        except Exception as exc:  # Catch truly unexpected errors
-            LOGGER.exception("Fetcher %s encountered unexpected error: %s", fetcher.name, exc)
-            continue
+    results: List[List[Article]] = [[] for _ in fetchers]
+    with ThreadPoolExecutor(max_workers=max(len(fetchers), 1)) as executor:
+        futures = {
+            executor.submit(_run_fetcher, fetcher, config, seen_ids): index for index, fetcher in enumerate(fetchers)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            fetcher = fetchers[index]
+            try:
+                results[index] = future.result()
+            except (requests.RequestException, ValueError, KeyError) as exc:
+                LOGGER.error("Fetcher %s failed: %s", fetcher.name, exc)
+            except Exception as exc:  # Catch truly unexpected errors
+                LOGGER.exception("Fetcher %s encountered unexpected error: %s", fetcher.name, exc)
+
+    # Deduplicate in fetcher order so results do not depend on completion order.
+    for items in results:
         for article in items:
-            if article.id in seen_ids:
+            if article.id in collected_ids:
                 LOGGER.debug("Skipping duplicate article: %s", article.url)
                 continue
             if not _is_relevant(article):
                 LOGGER.debug("Filtered out non-relevant article: %s", article.title)
                 continue
-            seen_ids.add(article.id)
+            collected_ids.add(article.id)
             aggregated.append(article)
 
     LOGGER.info("Collected %d unique articles", len(aggregated))
     return aggregated
 
 
+def _run_fetcher(fetcher: NewsFetcher, config: Config, seen_ids: AbstractSet[str]) -> List[Article]:
+    """Call ``fetcher.fetch``, passing ``seen_ids`` only if its signature accepts it.
+
+    Custom fetchers written against the original ``fetch(config)`` signature keep working.
+    """
+    try:
+        parameters = inspect.signature(fetcher.fetch).parameters.values()
+    except (TypeError, ValueError):
+        return fetcher.fetch(config)
+    if any(p.name == "seen_ids" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return fetcher.fetch(config, seen_ids=seen_ids)
+    return fetcher.fetch(config)
+
+
 def _is_relevant(article: Article) -> bool:
-    text = f"{article.title} {article.summary or ''}".lower()
-    keywords = ["paypal", "pypl"]
-    return any(keyword in text for keyword in keywords)
+    return bool(_RELEVANT_RE.search(article.title) or (article.summary and _RELEVANT_RE.search(article.summary)))
@@ -0,0 +1,34 @@
+"""Shared HTTP session used by the fetchers and article scraping."""
+
+from __future__ import annotations
+
+from functools import cache
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+
+@cache
+def get_session(data_dir: Path) -> requests.Session:
+    """Return the HTTP session shared by fetchers and content scraping.
+
+    Connections are pooled with keep-alive, and GET responses are cached in a
+    SQLite database under ``data_dir`` so repeat runs skip unchanged downloads.
+    """
+    session = CachedSession(
+        cache_name=str(data_dir / "http_cache"),
+        backend="sqlite",
+        expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+        allowable_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+__all__ = ["HTTP_CACHE_EXPIRE_SECONDS", "get_session"]
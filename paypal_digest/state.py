@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, KeysView
+
+import orjson
 
 LOGGER = logging.getLogger(__name__)
 
@@ -22,18 +23,19 @@ class StateStore:
         if not self.path.exists():
             return
         try:
-            self._data = json.loads(self.path.read_text())
-        except json.JSONDecodeError as exc:
+            self._data = orjson.loads(self.path.read_bytes())
+        except orjson.JSONDecodeError as exc:
             LOGGER.warning("Could not parse state file %s: %s", self.path, exc)
             self._data = {}
 
     def save(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._data, indent=2, sort_keys=True))
+        self.path.write_bytes(orjson.dumps(self._data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2))
 
     @property
-    def seen_ids(self) -> Set[str]:
-        return set(self._data.keys())
+    def seen_ids(self) -> KeysView[str]:
+        """Live view of processed IDs; membership checks are O(1) without copying."""
+        return self._data.keys()
 
     def mark_seen(self, article_id: str, title: str) -> None:
         self._data[article_id] = title
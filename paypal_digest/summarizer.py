@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, List
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.parsers.plaintext import PlaintextParser
@@ -11,28 +13,299 @@ from sumy.summarizers.lsa import LsaSummarizer
 from sumy.nlp.stemmers import Stemmer
 from sumy.utils import get_stop_words
 
-from .config import Config
+from .config import BATCH_BACKENDS, Config
 
 LOGGER = logging.getLogger(__name__)
 LANGUAGE = "english"
 
+T = TypeVar("T")
+
+TRANSFORMER_MODEL = "sshleifer/distilbart-cnn-12-6"
+TRANSFORMER_BATCH_SIZE = 8
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = 64
+
+# The tokenizer and summarizer are immutable, so build them once per process. They are
+# created on first use because the tokenizer needs NLTK punkt data, which importing the
+# package must not require.
+@lru_cache(maxsize=1)
+def _get_tokenizer() -> Tokenizer:
+    return Tokenizer(LANGUAGE)
+
+
+@lru_cache(maxsize=1)
+def _get_summarizer() -> LsaSummarizer:
+    summarizer = LsaSummarizer(Stemmer(LANGUAGE))
+    summarizer.stop_words = frozenset(get_stop_words(LANGUAGE))
+    return summarizer
+
 
 def summarize_text(text: str, config: Config) -> str:
     """Summarize an article body into a concise highlight."""
 
-    parser = PlaintextParser.from_string(text, Tokenizer(LANGUAGE))
-    summarizer = LsaSummarizer(Stemmer(LANGUAGE))
-    summarizer.stop_words = get_stop_words(LANGUAGE)
+    parser = PlaintextParser.from_string(text, _get_tokenizer())
+    summarizer = _get_summarizer()
 
     sentences = summarizer(parser.document, config.summary_sentence_count)
     summary = " ".join(str(sentence) for sentence in sentences).strip()
     if not summary:
         # Fall back to the opening of the article if summarizer fails.
-        summary = " ".join(text.split()[:config.summary_fallback_words])
+        summary = _fallback_summary(text, config)
     return summary
 
 
+def _fallback_summary(text: str, config: Config) -> str:
+    return " ".join(text.split()[:config.summary_fallback_words])
+
+
+@lru_cache(maxsize=1)
+def _get_transformer_pipeline(quantized_dir: Optional[Path] = None) -> Optional[Any]:
+    """Load the HuggingFace summarization pipeline, or None if unavailable.
+
+    When ``quantized_dir`` is given the model is served from an INT8 ONNX export
+    stored there, falling back to the FP32 model if optimum is not installed.
+    """
+
+    try:
+        from transformers import pipeline
+    except ImportError:
+        LOGGER.warning("transformers is not installed; falling back to LSA summarization.")
+        return None
+
+    if quantized_dir is not None:
+        quantized = _load_quantized_model(quantized_dir)
+        if quantized is not None:
+            model, tokenizer = quantized
+            return pipeline("summarization", model=model, tokenizer=tokenizer)
+    try:
+        return pipeline("summarization", model=TRANSFORMER_MODEL)
+    except Exception as exc:  # Download or load failures should not abort the digest
+        LOGGER.warning("Could not load %s (%s); falling back to LSA summarization.", TRANSFORMER_MODEL, exc)
+        return None
+
+
+def _load_quantized_model(model_dir: Path) -> Optional[Tuple[Any, Any]]:
+    """Return an INT8 ONNX Runtime model and its tokenizer, exporting on first use."""
+
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+    except ImportError:
+        LOGGER.warning("optimum[onnxruntime] is not installed; using the unquantized summarizer.")
+        return None
+
+    try:
+        if not (model_dir / "encoder_model_quantized.onnx").exists():
+            LOGGER.info("Exporting and quantizing %s to %s", TRANSFORMER_MODEL, model_dir)
+            model = ORTModelForSeq2SeqLM.from_pretrained(TRANSFORMER_MODEL, export=True)
+            model.save_pretrained(model_dir)
+            AutoTokenizer.from_pretrained(TRANSFORMER_MODEL).save_pretrained(model_dir)
+
+            # Dynamic quantization needs no calibration data; each ONNX graph is quantized separately.
+            quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            for onnx_file in sorted(model_dir.glob("*.onnx")):
+                if onnx_file.stem.endswith("_quantized"):
+                    continue
+                quantizer = ORTQuantizer.from_pretrained(model_dir, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=model_dir, quantization_config=quantization_config)
+
+        decoder_with_past = model_dir / "decoder_with_past_model_quantized.onnx"
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_dir,
+            encoder_file_name="encoder_model_quantized.onnx",
+            decoder_file_name="decoder_model_quantized.onnx",
+            decoder_with_past_file_name=decoder_with_past.name if decoder_with_past.exists() else None,
+            use_cache=decoder_with_past.exists(),
+        )
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    except Exception as exc:  # Export or load failures should not abort the digest
+        LOGGER.warning(
+            "Could not prepare the quantized model in %s (%s); using the unquantized summarizer.", model_dir, exc
+        )
+        return None
+    return model, tokenizer
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_model() -> Optional[Any]:
+    """Load the sentence embedding model, or None if unavailable."""
+
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        LOGGER.warning("sentence-transformers is not installed; falling back to LSA summarization.")
+        return None
+    try:
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except Exception as exc:  # Download or load failures should not abort the digest
+        LOGGER.warning("Could not load %s (%s); falling back to LSA summarization.", EMBEDDING_MODEL, exc)
+        return None
+
+
+def _centroid_summarize(texts: List[str], model: Any, config: Config) -> List[str]:
+    """Pick the sentences of each text closest to that text's embedding centroid.
+
+    Sentences from every text are encoded in a single batched call and then
+    scored against the centroid of the article they came from.
+    """
+
+    import numpy as np
+
+    sentence_groups, all_sentences = _split_sentences(texts)
+    if not all_sentences:
+        return [_fallback_summary(text, config) for text in texts]
+
+    embeddings = model.encode(
+        all_sentences,
+        batch_size=EMBEDDING_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+
+    owners = np.repeat(np.arange(len(sentence_groups)), [len(group) for group in sentence_groups])
+    # Summed rather than averaged: scaling a centroid does not change the ranking within its article.
+    centroids = np.zeros((len(sentence_groups), embeddings.shape[1]), dtype=embeddings.dtype)
+    np.add.at(centroids, owners, embeddings)
+    # Embeddings are unit length, so the dot product ranks by cosine similarity.
+    scores = np.einsum("ij,ij->i", embeddings, centroids[owners])
+    return _summaries_from_scores(texts, sentence_groups, scores, config)
+
+
+def _tfidf_summarize(texts: List[str], config: Config) -> Optional[List[str]]:
+    """Score every sentence with a TF-IDF model shared across all texts.
+
+    All sentences are vectorized in one pass into a single sparse matrix, then
+    each article's row block gets its own leading singular vector so salience
+    reflects that article's main topic rather than the batch's dominant one.
+    Returns None if scikit-learn is unavailable or there is no usable vocabulary.
+    """
+
+    try:
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        LOGGER.warning("scikit-learn is not installed; falling back to LSA summarization.")
+        return None
+
+    sentence_groups, all_sentences = _split_sentences(texts)
+    try:
+        matrix = TfidfVectorizer(stop_words="english").fit_transform(all_sentences)
+    except ValueError:
+        LOGGER.debug("No usable vocabulary for TF-IDF summarization; falling back to LSA.")
+        return None
+
+    salience = np.zeros(matrix.shape[0])
+    offset = 0
+    for sentences in sentence_groups:
+        end = offset + len(sentences)
+        block = matrix[offset:end]
+        if block.nnz:
+            # The leading eigenvector of the small sentence-by-sentence Gram matrix is the
+            # block's leading left singular vector; its sign is arbitrary, so rank on magnitude.
+            _, eigenvectors = np.linalg.eigh((block @ block.T).toarray())
+            salience[offset:end] = np.abs(eigenvectors[:, -1])
+        offset = end
+    return _summaries_from_scores(texts, sentence_groups, salience, config)
+
+
+def _split_sentences(texts: List[str]) -> Tuple[List[List[str]], List[str]]:
+    """Return each text's sentences plus all sentences flattened in the same order."""
+
+    sentence_groups = [list(_get_tokenizer().to_sentences(text)) for text in texts]
+    all_sentences = [sentence for group in sentence_groups for sentence in group]
+    return sentence_groups, all_sentences
+
+
+def _summaries_from_scores(
+    texts: List[str],
+    sentence_groups: List[List[str]],
+    scores: Any,
+    config: Config,
+) -> List[str]:
+    """Slice flat per-sentence ``scores`` back out per article and summarize each."""
+
+    summaries: List[str] = []
+    offset = 0
+    for text, sentences in zip(texts, sentence_groups, strict=True):
+        count = len(sentences)
+        article_scores = scores[offset:offset + count]
+        offset += count
+        if not count:
+            summaries.append(_fallback_summary(text, config))
+            continue
+        summaries.append(_join_top_sentences(sentences, article_scores, config.summary_sentence_count))
+    return summaries
+
+
+def _join_top_sentences(sentences: List[str], scores: Any, count: int) -> str:
+    """Join the ``count`` highest-scoring sentences in their original order.
+
+    If every score is zero there is nothing to rank on, so the leading sentences are used.
+    """
+
+    import numpy as np
+
+    k = min(count, len(sentences))
+    if k < len(sentences) and np.any(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(k)
+    return " ".join(sentences[index] for index in sorted(top))
+
+
 def batch_summarize(texts: Iterable[str], config: Config) -> List[str]:
-    """Summarize multiple texts."""
+    """Summarize multiple texts.
+
+    With the ``transformer`` backend all texts go through the model in batched
+    forward passes, with ``embedding`` all sentences are encoded at once for
+    centroid-based extraction, and with ``tfidf`` all sentences share a single
+    TF-IDF vocabulary scored per article; otherwise each text is summarized with LSA.
+    """
+
+    texts = list(texts)
+    if not texts:
+        return []
+
+    if config.summarizer_backend == "transformer":
+        quantized_dir = config.data_dir / "models" / "distilbart-cnn-12-6-int8" if config.quantize_summarizer else None
+        pipe = _get_transformer_pipeline(quantized_dir)
+        if pipe is not None:
+            results = pipe(
+                texts,
+                max_length=120,
+                min_length=30,
+                truncation=True,
+                batch_size=TRANSFORMER_BATCH_SIZE,
+            )
+            return [result["summary_text"].strip() for result in results]
+
+    if config.summarizer_backend == "embedding":
+        model = _get_embedding_model()
+        if model is not None:
+            return _centroid_summarize(texts, model, config)
+
+    if config.summarizer_backend == "tfidf":
+        summaries = _tfidf_summarize(texts, config)
+        if summaries is not None:
+            return summaries
 
     return [summarize_text(text, config) for text in texts]
+
+
+def iter_summaries(items: Iterable[Tuple[T, str]], config: Config) -> Iterator[Tuple[T, str]]:
+    """Yield ``(key, summary)`` for each ``(key, text)`` pair, in order.
+
+    The LSA backend summarizes each text as soon as it is available, so a lazy
+    input such as in-flight scraping results overlaps with summarization.
+    Batch backends consume the whole input before producing anything.
+    """
+
+    if config.summarizer_backend in BATCH_BACKENDS:
+        pairs = list(items)
+        summaries = batch_summarize([text for _, text in pairs], config)
+        yield from zip([key for key, _ in pairs], summaries, strict=True)
+        return
+    for key, text in items:
+        yield key, summarize_text(text, config)
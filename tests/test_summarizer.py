@@ -0,0 +1,42 @@
+"""Tests for the extractive summarization backends."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from paypal_digest.config import Config  # noqa: E402
+from paypal_digest.summarizer import _get_tokenizer, _tfidf_summarize  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _require_punkt() -> None:
+    try:
+        _get_tokenizer().to_sentences("One sentence. Another sentence.")
+    except LookupError:
+        pytest.skip("NLTK punkt data is not installed")
+
+
+def test_tfidf_summarizes_topic_disjoint_articles_independently() -> None:
+    earnings = (
+        "PayPal reported strong quarterly revenue. "
+        "The weather was mild. "
+        "Quarterly revenue beat analyst estimates. "
+        "Strong revenue growth lifted analyst targets."
+    )
+    crypto = (
+        "Venmo added bitcoin trading. "
+        "Lunch was served. "
+        "Venmo users can now buy bitcoin. "
+        "Bitcoin trading launched for Venmo users."
+    )
+    config = Config(newsapi_key=None, summary_sentence_count=2)
+
+    summaries = _tfidf_summarize([earnings, crypto], config)
+
+    assert summaries is not None
+    earnings_summary, crypto_summary = summaries
+    assert "weather" not in earnings_summary
+    assert "Lunch" not in crypto_summary
+    assert "bitcoin" in crypto_summary.lower()